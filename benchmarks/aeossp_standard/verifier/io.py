@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 import json
@@ -10,6 +11,12 @@ import json
 import brahe
 import yaml
 
+try:
+    # tasks.yaml dominates case loading; use libyaml when PyYAML was built with it.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .models import (
     AeosspCase,
     AeosspSolution,
@@ -25,20 +32,33 @@ from .models import (
 
 
 def _load_yaml(path: Path) -> Any:
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
 
 
 def _load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+@lru_cache(maxsize=8192)
+def _parse_utc_timestamp(value: str) -> datetime | None:
+    """Cached ISO 8601 parse to UTC; ``None`` when the string has no timezone.
+
+    Task windows repeat the same release/due instants heavily, and datetimes are
+    immutable, so parsed values are shared across callers.
+    """
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        return None
+    return parsed.astimezone(UTC)
+
+
 def _parse_iso_utc(value: str, *, field_name: str) -> datetime:
     if not isinstance(value, str):
         raise ValueError(f"{field_name} must be an ISO 8601 timestamp string")
-    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-    if parsed.tzinfo is None:
+    parsed = _parse_utc_timestamp(value)
+    if parsed is None:
         raise ValueError(f"{field_name} must include timezone information")
-    return parsed.astimezone(UTC)
+    return parsed
 
 
 def _require_mapping(payload: Any, context: str) -> dict[str, Any]:
@@ -7,7 +7,7 @@ import math
 import random
 import shutil
 from collections import Counter
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -384,6 +384,13 @@ def _generate_region_grid(region: RegionRecord, sample_spacing_m: float) -> Regi
     )
 
 
+def _grid_sample_payload(sample: GridSample) -> dict[str, Any]:
+    # Grids hold tens of thousands of samples. A shallow mapping over the
+    # dataclass fields skips the recursive deep copy that asdict performs on
+    # these flat scalar fields.
+    return {f.name: getattr(sample, f.name) for f in fields(sample)}
+
+
 def _coverage_grid_payload(grids: tuple[RegionCoverageGrid, ...], sample_spacing_m: float) -> dict[str, Any]:
     return {
         "grid_version": 1,
@@ -392,7 +399,7 @@ def _coverage_grid_payload(grids: tuple[RegionCoverageGrid, ...], sample_spacing
             {
                 "region_id": grid.region_id,
                 "total_weight_m2": grid.total_weight_m2,
-                "samples": [asdict(sample) for sample in grid.samples],
+                "samples": [_grid_sample_payload(sample) for sample in grid.samples],
             }
             for grid in grids
         ],
@@ -13,8 +13,8 @@ import math
 import brahe
 import numpy as np
 import yaml
+from shapely import STRtree
 from shapely.geometry import Point, Polygon
-from shapely.prepared import prep
 
 
 _NUMERICAL_EPS = 1.0e-9
@@ -87,6 +87,7 @@ class RegionGrid:
     latitudes_deg: np.ndarray
     weights_m2: np.ndarray
     coverage_counts: np.ndarray
+    sample_tree: STRtree = field(repr=False)
 
 
 @dataclass(frozen=True)
@@ -454,6 +455,7 @@ def _load_coverage_grid(case_dir: Path, regions: dict[str, Region]) -> dict[str,
             latitudes_deg=np.asarray(latitudes, dtype=float),
             weights_m2=np.asarray(weights, dtype=float),
             coverage_counts=np.zeros(len(samples), dtype=np.int32),
+            sample_tree=STRtree([sample.point for sample in samples]),
         )
     if set(region_grids) != set(regions):
         missing = sorted(set(regions) - set(region_grids))
@@ -644,6 +646,21 @@ def _parse_actions(case: CaseData, solution_path: str | Path) -> tuple[list[Pars
             f"{case.manifest.max_actions_total}"
         )
 
+    # Per-case invariants, hoisted out of the per-action loop: the grid step and,
+    # per satellite, (half_fov, min_inner, max_outer, min_duration, max_duration)
+    # with the 1e-6 tolerances already applied.
+    time_step_s = float(case.manifest.time_step_s)
+    strip_limits = {
+        satellite_id: (
+            0.5 * satellite.sensor.cross_track_fov_deg,
+            satellite.sensor.min_edge_off_nadir_deg - 1.0e-6,
+            satellite.sensor.max_edge_off_nadir_deg + 1.0e-6,
+            satellite.sensor.min_strip_duration_s - 1.0e-6,
+            satellite.sensor.max_strip_duration_s + 1.0e-6,
+        )
+        for satellite_id, satellite in case.satellites.items()
+    }
+
     for index, raw_action in enumerate(raw_actions):
         raw_type = raw_action.get("type")
         if raw_type != "strip_observation":
@@ -677,26 +694,28 @@ def _parse_actions(case: CaseData, solution_path: str | Path) -> tuple[list[Pars
                 f"{prefix}: unknown satellite_id {action.satellite_id!r}"
             )
         else:
-            fov = satellite.sensor.cross_track_fov_deg
+            half_fov, min_inner, max_outer, min_duration, max_duration = strip_limits[
+                action.satellite_id
+            ]
             center_abs = abs(action.roll_deg)
-            action.theta_inner_deg = center_abs - (0.5 * fov)
-            action.theta_outer_deg = center_abs + (0.5 * fov)
-            if action.theta_inner_deg < satellite.sensor.min_edge_off_nadir_deg - 1.0e-6:
+            action.theta_inner_deg = center_abs - half_fov
+            action.theta_outer_deg = center_abs + half_fov
+            if action.theta_inner_deg < min_inner:
                 action.violations.append(
                     f"{prefix}: theta_inner_deg={action.theta_inner_deg:.6f} below "
                     f"min_edge_off_nadir_deg={satellite.sensor.min_edge_off_nadir_deg:.6f}"
                 )
-            if action.theta_outer_deg > satellite.sensor.max_edge_off_nadir_deg + 1.0e-6:
+            if action.theta_outer_deg > max_outer:
                 action.violations.append(
                     f"{prefix}: theta_outer_deg={action.theta_outer_deg:.6f} above "
                     f"max_edge_off_nadir_deg={satellite.sensor.max_edge_off_nadir_deg:.6f}"
                 )
-            if action.duration_s < satellite.sensor.min_strip_duration_s - 1.0e-6:
+            if action.duration_s < min_duration:
                 action.violations.append(
                     f"{prefix}: duration_s={action.duration_s:.6f} below "
                     f"min_strip_duration_s={satellite.sensor.min_strip_duration_s:.6f}"
                 )
-            if action.duration_s > satellite.sensor.max_strip_duration_s + 1.0e-6:
+            if action.duration_s > max_duration:
                 action.violations.append(
                     f"{prefix}: duration_s={action.duration_s:.6f} above "
                     f"max_strip_duration_s={satellite.sensor.max_strip_duration_s:.6f}"
@@ -718,11 +737,11 @@ def _parse_actions(case: CaseData, solution_path: str | Path) -> tuple[list[Pars
         start_offset_s = (
             action.start_time - case.manifest.horizon_start
         ).total_seconds()
-        if not _is_aligned(start_offset_s, float(case.manifest.time_step_s)):
+        if not _is_aligned(start_offset_s, time_step_s):
             action.violations.append(
                 f"{prefix}: start_time must align to the {case.manifest.time_step_s}s time grid"
             )
-        if not _is_aligned(action.duration_s, float(case.manifest.time_step_s)):
+        if not _is_aligned(action.duration_s, time_step_s):
             action.violations.append(
                 f"{prefix}: duration_s must be an integer multiple of "
                 f"{case.manifest.time_step_s}s"
@@ -844,21 +863,15 @@ def _apply_coverage(
             region_id: set() for region_id in case.region_grids
         }
         for segment in action.segment_polygons:
-            segment_min_lon, segment_min_lat, segment_max_lon, segment_max_lat = segment.bounds
-            prepared = prep(segment)
             for region_grid in case.region_grids.values():
-                candidate_mask = (
-                    (region_grid.longitudes_deg >= segment_min_lon)
-                    & (region_grid.longitudes_deg <= segment_max_lon)
-                    & (region_grid.latitudes_deg >= segment_min_lat)
-                    & (region_grid.latitudes_deg <= segment_max_lat)
-                )
-                candidate_indices = np.flatnonzero(candidate_mask)
-                for sample_index in candidate_indices:
-                    sample = region_grid.samples[int(sample_index)]
-                    if not prepared.covers(sample.point):
-                        continue
-                    matches_by_region[region_grid.region.region_id].add(int(sample_index))
+                # One vectorized covers predicate over the tree's envelope
+                # candidates; sorted so coverage weights accumulate in sample order.
+                covered_indices = np.sort(
+                    region_grid.sample_tree.query(segment, predicate="covers")
+                ).tolist()
+                matches_by_region[region_grid.region.region_id].update(covered_indices)
+                for sample_index in covered_indices:
+                    sample = region_grid.samples[sample_index]
                     if sample.sample_id in covered_sample_ids:
                         continue
                     covered_sample_ids.add(sample.sample_id)
@@ -866,9 +879,7 @@ def _apply_coverage(
         for region_id, matched_indices in matches_by_region.items():
             if not matched_indices:
                 continue
-            region_grid = case.region_grids[region_id]
-            for sample_index in matched_indices:
-                region_grid.coverage_counts[sample_index] += 1
+            case.region_grids[region_id].coverage_counts[list(matched_indices)] += 1
         action.covered_sample_ids = sorted(covered_sample_ids)
         action.covered_region_ids = sorted(
             region_id for region_id, matched_indices in matches_by_region.items() if matched_indices
@@ -925,8 +936,26 @@ def _check_overlaps_and_slew(
     return maneuvers, total_slew_angle_deg
 
 
-def _interval_contains(instant: datetime, start: datetime, end: datetime) -> bool:
-    return start <= instant < end
+def _active_counts(
+    sorted_points: list[datetime],
+    intervals: list[tuple[datetime, datetime]],
+) -> list[int]:
+    """Count of half-open intervals covering each segment ``[points[i], points[i + 1])``.
+
+    Every interval endpoint must be one of ``sorted_points``; the counts then come
+    from one sweep over +1/-1 deltas instead of testing every interval per segment.
+    """
+    deltas: dict[datetime, int] = {}
+    for start, end in intervals:
+        if start < end:
+            deltas[start] = deltas.get(start, 0) + 1
+            deltas[end] = deltas.get(end, 0) - 1
+    counts: list[int] = []
+    active = 0
+    for point in sorted_points:
+        active += deltas.get(point, 0)
+        counts.append(active)
+    return counts
 
 
 def _build_time_mesh(start: datetime, end: datetime, step_s: int) -> list[datetime]:
@@ -939,6 +968,27 @@ def _build_time_mesh(start: datetime, end: datetime, step_s: int) -> list[dateti
     return points
 
 
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _time_past_edges_us(
+    sorted_edges_us: np.ndarray, edge_prefix_us: np.ndarray, times_us: np.ndarray
+) -> np.ndarray:
+    # sum(max(t - edge, 0)) over all edges, evaluated for every t at once.
+    counts = np.searchsorted(sorted_edges_us, times_us, side="left")
+    return counts * times_us - edge_prefix_us[counts]
+
+
+def _imaged_before_us(
+    starts_us: np.ndarray, ends_us: np.ndarray, times_us: np.ndarray
+) -> np.ndarray:
+    start_prefix_us = np.concatenate(([0], np.cumsum(starts_us)))
+    end_prefix_us = np.concatenate(([0], np.cumsum(ends_us)))
+    return _time_past_edges_us(starts_us, start_prefix_us, times_us) - _time_past_edges_us(
+        ends_us, end_prefix_us, times_us
+    )
+
+
 def _check_imaging_duty_limits(
     case: CaseData, parsed_actions: list[ParsedAction], violations: list[str]
 ) -> None:
@@ -947,30 +997,46 @@ def _check_imaging_duty_limits(
         if action.accepted_for_schedule:
             actions_by_satellite.setdefault(action.satellite_id, []).append(action)
 
+    reference = case.manifest.horizon_start
     for satellite_id, actions in actions_by_satellite.items():
         satellite = case.satellites[satellite_id]
         limit_s = satellite.power.imaging_duty_limit_s_per_orbit
         if limit_s is None:
             continue
         orbit_period_s = _orbit_period_s(satellite)
-        boundaries: list[datetime] = []
-        for action in actions:
-            boundaries.append(action.start_time)
-            boundaries.append(action.end_time or action.start_time)
-        for boundary in sorted(set(boundaries)):
-            window_start = boundary - timedelta(seconds=orbit_period_s)
-            used_s = 0.0
-            for action in actions:
-                interval_start = max(window_start, action.start_time)
-                interval_end = min(boundary, action.end_time or action.start_time)
-                if interval_end > interval_start:
-                    used_s += (interval_end - interval_start).total_seconds()
-            if used_s > limit_s + 1.0e-6:
-                violations.append(
-                    f"satellite {satellite_id}: imaging duty limit exceeded over one orbit "
-                    f"(used {used_s:.3f}s, limit {limit_s:.3f}s)"
-                )
-                break
+        # Integer microseconds keep the prefix-sum differences exact.
+        starts_us = np.sort(
+            np.array(
+                [(action.start_time - reference) // _MICROSECOND for action in actions],
+                dtype=np.int64,
+            )
+        )
+        ends_us = np.sort(
+            np.array(
+                [
+                    ((action.end_time or action.start_time) - reference) // _MICROSECOND
+                    for action in actions
+                ],
+                dtype=np.int64,
+            )
+        )
+
+        # Imaging time inside [window_start, boundary] is F(boundary) - F(window_start),
+        # where F(t) is the total imaging time accumulated before t. F is zero before
+        # the first start, so clamping window starts there is exact.
+        boundaries_us = np.unique(np.concatenate((starts_us, ends_us)))
+        period_us = timedelta(seconds=orbit_period_s) // _MICROSECOND
+        window_starts_us = np.maximum(boundaries_us - period_us, starts_us[0])
+        imaged_us = _imaged_before_us(
+            starts_us, ends_us, np.concatenate((boundaries_us, window_starts_us))
+        )
+        used_s = (imaged_us[: boundaries_us.size] - imaged_us[boundaries_us.size :]) / 1.0e6
+        exceeded = np.flatnonzero(used_s > limit_s + 1.0e-6)
+        if exceeded.size:
+            violations.append(
+                f"satellite {satellite_id}: imaging duty limit exceeded over one orbit "
+                f"(used {float(used_s[exceeded[0]]):.3f}s, limit {limit_s:.3f}s)"
+            )
 
 
 def _simulate_power(
@@ -1018,21 +1084,23 @@ def _simulate_power(
         imaging_energy_wh = 0.0
         charging_energy_wh = 0.0
         sorted_points = sorted(time_points)
-        for start, end in zip(sorted_points, sorted_points[1:]):
+        imaging_counts = _active_counts(
+            sorted_points,
+            [(action.start_time, action.end_time or action.start_time) for action in sat_actions],
+        )
+        slew_counts = _active_counts(
+            sorted_points,
+            [(maneuver.start_time, maneuver.end_time) for maneuver in sat_maneuvers],
+        )
+        for index, (start, end) in enumerate(zip(sorted_points, sorted_points[1:])):
             duration_s = (end - start).total_seconds()
             if duration_s <= 0.0:
                 continue
             midpoint = start + ((end - start) / 2)
             epoch = _datetime_to_epoch(midpoint)
             state_eci = np.asarray(propagator.state_eci(epoch), dtype=float).reshape(6)
-            imaging_active = any(
-                _interval_contains(midpoint, action.start_time, action.end_time or action.start_time)
-                for action in sat_actions
-            )
-            slew_active = any(
-                _interval_contains(midpoint, maneuver.start_time, maneuver.end_time)
-                for maneuver in sat_maneuvers
-            )
+            imaging_active = imaging_counts[index] > 0
+            slew_active = slew_counts[index] > 0
             charge_power_w = (
                 satellite.power.sunlit_charge_power_w
                 if _is_sunlit(state_eci[:3], epoch)
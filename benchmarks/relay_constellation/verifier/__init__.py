@@ -1,27 +1,38 @@
 """Public API for the relay_constellation verifier."""
 
-from .engine import analyze, analyze_solution, verify, verify_solution
-from .io import load_case, load_solution
-from .models import (
-    ActionFailure,
-    DEFAULT_DATASET_DIR,
-    LIGHT_SPEED_M_S,
-    NUMERICAL_EPS,
-    OrbitSummary,
-    PathCandidate,
-    RelayAction,
-    RelayCase,
-    RelayDemand,
-    RelayEndpoint,
-    RelayManifest,
-    RelaySatellite,
-    RelaySolution,
-    SampleAllocation,
-    SampleRouteAssignment,
-    SolutionAnalysis,
-    ValidatedAction,
-    VerificationResult,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+# Submodules are imported on first attribute access so that importing the
+# package (e.g. for ``python -m ...verifier.run --help``) does not load brahe.
+_EXPORTS = {
+    "ActionFailure": "models",
+    "DEFAULT_DATASET_DIR": "models",
+    "LIGHT_SPEED_M_S": "models",
+    "NUMERICAL_EPS": "models",
+    "OrbitSummary": "models",
+    "PathCandidate": "models",
+    "RelayAction": "models",
+    "RelayCase": "models",
+    "RelayDemand": "models",
+    "RelayEndpoint": "models",
+    "RelayManifest": "models",
+    "RelaySatellite": "models",
+    "RelaySolution": "models",
+    "SampleAllocation": "models",
+    "SampleRouteAssignment": "models",
+    "SolutionAnalysis": "models",
+    "ValidatedAction": "models",
+    "VerificationResult": "models",
+    "analyze": "engine",
+    "analyze_solution": "engine",
+    "load_case": "io",
+    "load_solution": "io",
+    "verify": "engine",
+    "verify_solution": "engine",
+}
 
 __all__ = [
     "ActionFailure",
@@ -49,3 +60,16 @@ __all__ = [
     "verify",
     "verify_solution",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -139,6 +139,13 @@ def _ground_link_feasible(
     *,
     max_ground_range_m: float | None,
 ) -> tuple[bool, float]:
+    # Cheapest-first: slant range is the plain ECEF separation, so clear range
+    # rejections skip the topocentric frame conversions entirely. The 1 m slack
+    # leaves borderline samples to the exact check below.
+    if max_ground_range_m is not None:
+        separation_m = float(np.linalg.norm(satellite_position_ecef_m - endpoint.ecef_position_m))
+        if separation_m > max_ground_range_m + 1.0:
+            return False, separation_m
     relative_enz = np.asarray(
         brahe.relative_position_ecef_to_enz(
             endpoint.ecef_position_m,
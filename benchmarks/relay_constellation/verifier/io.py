@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 import json
+import os
 
 import brahe
 import numpy as np
@@ -25,6 +26,19 @@ def _load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _require_case_files(case_path: Path, names: tuple[str, ...]) -> None:
+    # One directory scan instead of a stat per required file. is_file() follows
+    # symlinks, so directories and dangling links still count as missing.
+    try:
+        with os.scandir(case_path) as entries:
+            files = {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Case directory not found: {case_path}") from None
+    for name in names:
+        if name not in files:
+            raise FileNotFoundError(f"Missing case file: {case_path / name}")
+
+
 def _require_mapping(payload: Any, context: str) -> dict[str, Any]:
     if not isinstance(payload, dict):
         raise ValueError(f"{context} must be a JSON object")
@@ -86,14 +100,7 @@ def load_case(case_dir: str | Path) -> RelayCase:
     network_path = case_path / "network.json"
     demands_path = case_path / "demands.json"
 
-    if not case_path.is_dir():
-        raise FileNotFoundError(f"Case directory not found: {case_path}")
-    if not manifest_path.is_file():
-        raise FileNotFoundError(f"Missing case file: {manifest_path}")
-    if not network_path.is_file():
-        raise FileNotFoundError(f"Missing case file: {network_path}")
-    if not demands_path.is_file():
-        raise FileNotFoundError(f"Missing case file: {demands_path}")
+    _require_case_files(case_path, ("manifest.json", "network.json", "demands.json"))
 
     manifest_payload = _require_mapping(_load_json(manifest_path), "manifest.json")
     network_payload = _require_mapping(_load_json(network_path), "network.json")
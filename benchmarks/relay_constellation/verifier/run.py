@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import argparse
 
-from .engine import verify_solution
-
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
@@ -21,6 +19,8 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
+    from .engine import verify_solution
+
     result = verify_solution(args.case_dir, args.solution_path)
     print(result)
     return 0 if result.valid else 1
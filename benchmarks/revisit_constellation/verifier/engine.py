@@ -520,26 +520,31 @@ def _simulate_resources(
 def _compute_metrics(
     instance: Instance, successful_observations: list[ObservationRecord], satellite_count: int
 ) -> dict[str, Any]:
-    observations_by_target: dict[str, list[datetime]] = defaultdict(list)
+    # Midpoints are kept as integer microsecond offsets from the horizon start so
+    # per-target deduplication, sorting and gap statistics run on flat arrays.
+    one_us = timedelta(microseconds=1)
+    horizon_us = (instance.horizon_end - instance.horizon_start) // one_us
+    offsets_by_target: dict[str, list[int]] = defaultdict(list)
     for observation in successful_observations:
-        observations_by_target[observation.target_id].append(observation.midpoint)
+        offsets_by_target[observation.target_id].append(
+            (observation.midpoint - instance.horizon_start) // one_us
+        )
 
     target_gap_summary: dict[str, dict[str, float]] = {}
     target_capped_max_gaps: list[float] = []
 
     for target_id, target in instance.targets.items():
-        unique_midpoints = sorted(set(observations_by_target.get(target_id, [])))
-        times = [instance.horizon_start, *unique_midpoints, instance.horizon_end]
-        gaps_hours = [
-            (right - left).total_seconds() / 3600.0
-            for left, right in zip(times, times[1:])
-        ]
+        unique_offsets = np.unique(
+            np.asarray(offsets_by_target.get(target_id, []), dtype=np.int64)
+        )
+        times_us = np.concatenate(([0], unique_offsets, [horizon_us]))
+        gaps_hours = ((np.diff(times_us) / 1.0e6) / 3600.0).tolist()
         mean_gap = sum(gaps_hours) / len(gaps_hours)
         max_gap = max(gaps_hours)
         target_gap_summary[target_id] = {
             "mean_revisit_gap_hours": mean_gap,
             "max_revisit_gap_hours": max_gap,
-            "observation_count": len(unique_midpoints),
+            "observation_count": int(unique_offsets.size),
             "expected_revisit_period_hours": target.expected_revisit_period_hours,
         }
         target_capped_max_gaps.append(
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 import json
+import os
 
 import brahe
 import numpy as np
@@ -28,6 +29,19 @@ def _load_json(path: Path) -> Any:
         return json.load(handle)
 
 
+def _require_case_files(case_path: Path, names: tuple[str, ...]) -> None:
+    # One directory scan instead of a stat per required file. is_file() follows
+    # symlinks, so directories and dangling links still count as missing.
+    try:
+        with os.scandir(case_path) as entries:
+            files = {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Case directory not found: {case_path}") from None
+    for name in names:
+        if name not in files:
+            raise FileNotFoundError(f"Missing case file: {case_path / name}")
+
+
 def _parse_iso8601_utc(value: str) -> datetime:
     if not isinstance(value, str):
         raise ValueError(f"Expected ISO 8601 timestamp string, got {type(value).__name__}")
@@ -169,12 +183,7 @@ def load_case(case_dir: str | Path) -> Instance:
     assets_path = case_path / "assets.json"
     mission_path = case_path / "mission.json"
 
-    if not case_path.exists():
-        raise FileNotFoundError(f"Case directory not found: {case_path}")
-    if not assets_path.exists():
-        raise FileNotFoundError(f"Missing case file: {assets_path}")
-    if not mission_path.exists():
-        raise FileNotFoundError(f"Missing case file: {mission_path}")
+    _require_case_files(case_path, ("assets.json", "mission.json"))
 
     assets_payload = _require_mapping(_load_json(assets_path), "assets.json")
     mission_payload = _require_mapping(_load_json(mission_path), "mission.json")
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import math
 import random
-from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -361,6 +361,41 @@ def _strip_polyline_en(
     return pts
 
 
+def _action_strip_polyline_en(
+    cache: dict[tuple[str, str, datetime, datetime, float, float], list[tuple[float, float]]],
+    sf_sats: dict[str, EarthSatellite],
+    target_ecef: dict[str, np.ndarray],
+    action: ObservationAction,
+) -> list[tuple[float, float]]:
+    """Strip polyline for ``action``, memoized on the observation's content.
+
+    Pair and tri-stereo evaluation revisit the same observation many times, so the
+    key is what determines the strip (satellite, target, window, pointing) rather
+    than the action's position in the solution.
+    """
+    key = (
+        action.satellite_id,
+        action.target_id,
+        action.start,
+        action.end,
+        action.off_nadir_along_deg,
+        action.off_nadir_across_deg,
+    )
+    poly = cache.get(key)
+    if poly is None:
+        poly = _strip_polyline_en(
+            sf_sats[action.satellite_id],
+            target_ecef[action.target_id],
+            action.start,
+            action.end,
+            sample_step_s=8.0,
+            off_nadir_along_deg=action.off_nadir_along_deg,
+            off_nadir_across_deg=action.off_nadir_across_deg,
+        )
+        cache[key] = poly
+    return poly
+
+
 def _monte_carlo_overlap_fraction(
     aoi_radius_m: float,
     poly_a: list[tuple[float, float]],
@@ -555,8 +590,9 @@ def _register_access_interval(
         intervals[idx] = merged
         return aid
     aid = f"{sat_id}::{target_id}::{len(intervals)}"
-    intervals.append((start, end, aid))
-    intervals.sort(key=lambda item: item[0])
+    # Merging above never moves an interval ahead of an earlier start, so the list
+    # stays sorted and a single insertion replaces a full re-sort per registration.
+    bisect.insort(intervals, (start, end, aid), key=lambda item: item[0])
     return aid
 
 
@@ -669,7 +705,14 @@ def _evaluate_stereo_pair(
     stereo_mode: str,
     n_samples: int,
     role: str,
+    strip_polylines: dict[tuple[str, str, datetime, datetime, float, float], list[tuple[float, float]]]
+    | None = None,
+    mid_states: dict[int, tuple[np.ndarray, np.ndarray]] | None = None,
 ) -> dict[str, Any]:
+    if strip_polylines is None:
+        strip_polylines = {}
+    if mid_states is None:
+        mid_states = {}
     first_action = actions[first_index]
     second_action = actions[second_index]
     target_id = first_derived.target_id
@@ -680,8 +723,14 @@ def _evaluate_stereo_pair(
     first_sf = sf_sats[first_derived.satellite_id]
     second_sf = sf_sats[second_derived.satellite_id]
 
-    first_pos = _satellite_state_ecef_m(first_sf, _action_midpoint(first_action))[0]
-    second_pos = _satellite_state_ecef_m(second_sf, _action_midpoint(second_action))[0]
+    if first_index in mid_states:
+        first_pos = mid_states[first_index][0]
+    else:
+        first_pos = _satellite_state_ecef_m(first_sf, _action_midpoint(first_action))[0]
+    if second_index in mid_states:
+        second_pos = mid_states[second_index][0]
+    else:
+        second_pos = _satellite_state_ecef_m(second_sf, _action_midpoint(second_action))[0]
     first_view = (first_pos - target_pos) / np.linalg.norm(first_pos - target_pos)
     second_view = (second_pos - target_pos) / np.linalg.norm(second_pos - target_pos)
     gamma = _angle_between_deg(first_view, second_view)
@@ -703,24 +752,8 @@ def _evaluate_stereo_pair(
     second_half_width_m = second_derived.slant_range_m * math.tan(
         math.radians(second_sat.half_cross_track_fov_deg)
     )
-    first_poly = _strip_polyline_en(
-        first_sf,
-        target_pos,
-        first_action.start,
-        first_action.end,
-        sample_step_s=8.0,
-        off_nadir_along_deg=first_action.off_nadir_along_deg,
-        off_nadir_across_deg=first_action.off_nadir_across_deg,
-    )
-    second_poly = _strip_polyline_en(
-        second_sf,
-        target_pos,
-        second_action.start,
-        second_action.end,
-        sample_step_s=8.0,
-        off_nadir_along_deg=second_action.off_nadir_along_deg,
-        off_nadir_across_deg=second_action.off_nadir_across_deg,
-    )
+    first_poly = _action_strip_polyline_en(strip_polylines, sf_sats, target_ecef, first_action)
+    second_poly = _action_strip_polyline_en(strip_polylines, sf_sats, target_ecef, second_action)
     window_keys = tuple(
         sorted((_observation_window_key(first_action), _observation_window_key(second_action)))
     )
@@ -844,6 +877,8 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
         by_sat.setdefault(act.satellite_id, []).append((i, act))
     for sid, lst in by_sat.items():
         lst.sort(key=lambda x: x[1].start)
+        sd = satellites[sid]
+        sf = sf_sats[sid]
         for j in range(len(lst) - 1):
             (_, a0), (_, a1) = lst[j], lst[j + 1]
             if a1.start < a0.end:
@@ -852,8 +887,6 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
                     f"[{a0.start.isoformat()}, {a0.end.isoformat()}) and "
                     f"[{a1.start.isoformat()}, {a1.end.isoformat()})"
                 )
-            sd = satellites[sid]
-            sf = sf_sats[sid]
             sp0, sv0 = _satellite_state_ecef_m(sf, a0.end)
             sp1, sv1 = _satellite_state_ecef_m(sf, a1.start)
             b0 = _boresight_unit_vector(
@@ -872,15 +905,19 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
                 )
 
     # Derived observations + access membership
+    mid_state_by_action: dict[int, tuple[np.ndarray, np.ndarray]] = {}
     for k, act in enumerate(actions):
         prefix = f"actions[{k}]"
         if act.satellite_id not in satellites or act.target_id not in targets:
             continue
         sd = satellites[act.satellite_id]
         tg = targets[act.target_id]
-        mid = act.start + (act.end - act.start) / 2
+        mid = _action_midpoint(act)
         sf = sf_sats[act.satellite_id]
+        # Midpoint states are propagated once here and reused by the pair and
+        # triple evaluations below.
         sp, sv = _satellite_state_ecef_m(sf, mid)
+        mid_state_by_action[k] = (sp, sv)
         te = target_ecef[act.target_id]
         epoch = _datetime_to_epoch(mid)
         el, saz = _solar_elevation_azimuth_deg(epoch, te)
@@ -966,6 +1003,9 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
         derived_by_target.setdefault(d.target_id, []).append((d.action_index, d))
 
     pair_diagnostics: list[dict[str, Any]] = []
+    strip_polylines: dict[
+        tuple[str, str, datetime, datetime, float, float], list[tuple[float, float]]
+    ] = {}
 
     per_target_best: dict[str, float] = {tid: 0.0 for tid in targets}
     covered: set[str] = set()
@@ -976,81 +1016,60 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
         obs_indices = [g[0] for g in group]
         ders = [g[1] for g in group]
         n = len(ders)
-        # pairwise
+        # Pair policy is evaluated once per (i, j); the pair and triple searches
+        # below only walk the allowed edges of this table.
+        pair_modes: dict[tuple[int, int], str] = {}
         for i in range(n):
             for j in range(i + 1, n):
-                di, dj = ders[i], ders[j]
-                ai = actions[obs_indices[i]]
-                aj = actions[obs_indices[j]]
-                stereo_mode = _stereo_pair_mode(mission, ai, aj, di, dj)
-                if stereo_mode is None:
-                    continue
-                pair_result = _evaluate_stereo_pair(
-                    case_id=case_id,
-                    mission=mission,
-                    satellites=satellites,
-                    targets=targets,
-                    sf_sats=sf_sats,
-                    target_ecef=target_ecef,
-                    actions=actions,
-                    first_index=obs_indices[i],
-                    second_index=obs_indices[j],
-                    first_derived=di,
-                    second_derived=dj,
-                    stereo_mode=stereo_mode,
-                    n_samples=100,
-                    role="pair_overlap",
+                stereo_mode = _stereo_pair_mode(
+                    mission, actions[obs_indices[i]], actions[obs_indices[j]], ders[i], ders[j]
                 )
-                pair_diagnostics.append(pair_result)
-                if pair_result["valid_pair"]:
-                    covered.add(target_id)
-                    if pair_result["q_pair"] > per_target_best[target_id]:
-                        per_target_best[target_id] = pair_result["q_pair"]
+                if stereo_mode is not None:
+                    pair_modes[(i, j)] = stereo_mode
+
+        # pairwise
+        for (i, j), stereo_mode in pair_modes.items():
+            di, dj = ders[i], ders[j]
+            pair_result = _evaluate_stereo_pair(
+                case_id=case_id,
+                mission=mission,
+                satellites=satellites,
+                targets=targets,
+                sf_sats=sf_sats,
+                target_ecef=target_ecef,
+                actions=actions,
+                first_index=obs_indices[i],
+                second_index=obs_indices[j],
+                first_derived=di,
+                second_derived=dj,
+                stereo_mode=stereo_mode,
+                n_samples=100,
+                role="pair_overlap",
+                strip_polylines=strip_polylines,
+                mid_states=mid_state_by_action,
+            )
+            pair_diagnostics.append(pair_result)
+            if pair_result["valid_pair"]:
+                covered.add(target_id)
+                if pair_result["q_pair"] > per_target_best[target_id]:
+                    per_target_best[target_id] = pair_result["q_pair"]
 
         # triples
         for i in range(n):
             for j in range(i + 1, n):
+                if (i, j) not in pair_modes:
+                    continue
                 for k in range(j + 1, n):
+                    if (i, k) not in pair_modes or (j, k) not in pair_modes:
+                        continue
                     a0, a1, a2 = actions[obs_indices[i]], actions[obs_indices[j]], actions[obs_indices[k]]
                     d0, d1, d2 = ders[i], ders[j], ders[k]
-                    edge_modes = [
-                        _stereo_pair_mode(mission, a0, a1, d0, d1),
-                        _stereo_pair_mode(mission, a0, a2, d0, d2),
-                        _stereo_pair_mode(mission, a1, a2, d1, d2),
-                    ]
-                    if any(mode is None for mode in edge_modes):
-                        continue
+                    edge_modes = [pair_modes[(i, j)], pair_modes[(i, k)], pair_modes[(j, k)]]
                     tri_ders = [d0, d1, d2]
                     tri_sat_defs = [satellites[d.satellite_id] for d in tri_ders]
-                    tri_sf_sats = [sf_sats[d.satellite_id] for d in tri_ders]
                     polys = [
-                        _strip_polyline_en(
-                            tri_sf_sats[0],
-                            te,
-                            a0.start,
-                            a0.end,
-                            8.0,
-                            off_nadir_along_deg=a0.off_nadir_along_deg,
-                            off_nadir_across_deg=a0.off_nadir_across_deg,
-                        ),
-                        _strip_polyline_en(
-                            tri_sf_sats[1],
-                            te,
-                            a1.start,
-                            a1.end,
-                            8.0,
-                            off_nadir_along_deg=a1.off_nadir_along_deg,
-                            off_nadir_across_deg=a1.off_nadir_across_deg,
-                        ),
-                        _strip_polyline_en(
-                            tri_sf_sats[2],
-                            te,
-                            a2.start,
-                            a2.end,
-                            8.0,
-                            off_nadir_along_deg=a2.off_nadir_along_deg,
-                            off_nadir_across_deg=a2.off_nadir_across_deg,
-                        ),
+                        _action_strip_polyline_en(strip_polylines, sf_sats, target_ecef, a)
+                        for a in (a0, a1, a2)
                     ]
                     hw = [
                         d0.slant_range_m * math.tan(math.radians(tri_sat_defs[0].half_cross_track_fov_deg)),
@@ -1096,9 +1115,11 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
                             second_index=obs_indices[jx],
                             first_derived=di,
                             second_derived=dj,
-                            stereo_mode=edge_modes[edge_idx] or "unknown",
+                            stereo_mode=edge_modes[edge_idx],
                             n_samples=80,
                             role="tri_pair_edge",
+                            strip_polylines=strip_polylines,
+                            mid_states=mid_state_by_action,
                         )
                         pair_flags.append(bool(edge_result["valid_pair"]))
                         pair_qs.append(float(edge_result["q_pair"]))
@@ -1144,7 +1165,7 @@ def verify_solution(case_dir: str | Path, solution_path: str | Path) -> Verifica
             "normalized_quality": float(normalized_quality),
         },
         violations=violations,
-        derived_observations=[asdict(d) for d in derived_list],
+        derived_observations=[d.to_dict() for d in derived_list],
         diagnostics={
             "pair_evaluations": pair_diagnostics,
             "per_target_best_score": {k: float(v) for k, v in per_target_best.items()},
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Mission:
     horizon_start: datetime
     horizon_end: datetime
@@ -23,7 +23,7 @@ class Mission:
     tri_stereo_bonus_by_scene: dict[str, float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SatelliteDef:
     sat_id: str
     norad_catalog_id: int
@@ -47,7 +47,7 @@ class SatelliteDef:
         return 0.5 * self.cross_track_fov_deg
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TargetDef:
     target_id: str
     latitude_deg: float
@@ -57,7 +57,7 @@ class TargetDef:
     scene_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObservationAction:
     satellite_id: str
     target_id: str
@@ -67,7 +67,7 @@ class ObservationAction:
     off_nadir_across_deg: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DerivedObservation:
     satellite_id: str
     target_id: str
@@ -85,6 +85,15 @@ class DerivedObservation:
     access_interval_id: str
     slant_range_m: float
 
+    def to_dict(self) -> dict[str, Any]:
+        # Shallow copy driven by the dataclass fields; dataclasses.asdict would
+        # recurse into every value. Only the flat list fields need copying.
+        payload: dict[str, Any] = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            payload[f.name] = list(value) if isinstance(value, list) else value
+        return payload
+
 
 @dataclass
 class VerificationReport:
@@ -6,9 +6,11 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import statistics
 import sys
 from collections import Counter
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -25,6 +27,48 @@ else:
 FAMILY_DIR = Path(__file__).resolve().parent
 DEFAULT_CONFIG = FAMILY_DIR / "configs" / "matrix.yaml"
 SUMMARY_VERSION = 1
+RUN_CSV_FIELDS = (
+    "config_name",
+    "benchmark",
+    "harness",
+    "split",
+    "case_id",
+    "result_path",
+    "artifact_state",
+    "mode",
+    "overall_status",
+    "agent_status",
+    "verifier_status",
+    "valid",
+    "duration_seconds",
+    "start_time",
+    "end_time",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    config_name: str
+    benchmark: str
+    harness: str
+    split: str
+    case_id: str
+    result_path: str
+    artifact_state: str
+    mode: str
+    overall_status: str
+    agent_status: str
+    verifier_status: str
+    valid: bool | None
+    duration_seconds: int | float | None
+    start_time: str | None
+    end_time: str | None
+    metrics: dict[str, Any]
+    flags: dict[str, bool | None]
+    raw_verifier: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -132,57 +176,30 @@ def _format_stat(value: Any) -> str:
     return str(value)
 
 
-def _build_missing_record(item: family_plan.RunItem) -> dict[str, Any]:
-    metrics = {metric.name: None for metric in item.benchmark_profile.score_metrics}
-    flags = {metric.name: None for metric in item.benchmark_profile.flag_metrics}
-    return {
-        "config_name": item.config_name,
-        "benchmark": item.benchmark,
-        "harness": item.harness,
-        "split": item.split,
-        "case_id": item.case_id,
-        "result_path": _relative_display(family_plan.run_output_dir(item)),
-        "artifact_state": "missing_artifact",
-        "mode": "batch",
-        "overall_status": "missing_artifact",
-        "agent_status": "missing_artifact",
-        "verifier_status": "missing_artifact",
-        "valid": None,
-        "duration_seconds": None,
-        "start_time": None,
-        "end_time": None,
-        "metrics": metrics,
-        "flags": flags,
-        "raw_verifier": {},
-    }
-
-
-def _build_malformed_record(item: family_plan.RunItem) -> dict[str, Any]:
-    metrics = {metric.name: None for metric in item.benchmark_profile.score_metrics}
-    flags = {metric.name: None for metric in item.benchmark_profile.flag_metrics}
-    return {
-        "config_name": item.config_name,
-        "benchmark": item.benchmark,
-        "harness": item.harness,
-        "split": item.split,
-        "case_id": item.case_id,
-        "result_path": _relative_display(family_plan.run_output_dir(item)),
-        "artifact_state": "malformed_artifact",
-        "mode": "batch",
-        "overall_status": "malformed_artifact",
-        "agent_status": "malformed_artifact",
-        "verifier_status": "malformed_artifact",
-        "valid": None,
-        "duration_seconds": None,
-        "start_time": None,
-        "end_time": None,
-        "metrics": metrics,
-        "flags": flags,
-        "raw_verifier": {},
-    }
+def _build_placeholder_record(item: family_plan.RunItem, artifact_state: str) -> RunRecord:
+    return RunRecord(
+        config_name=item.config_name,
+        benchmark=item.benchmark,
+        harness=item.harness,
+        split=item.split,
+        case_id=item.case_id,
+        result_path=_relative_display(family_plan.run_output_dir(item)),
+        artifact_state=artifact_state,
+        mode="batch",
+        overall_status=artifact_state,
+        agent_status=artifact_state,
+        verifier_status=artifact_state,
+        valid=None,
+        duration_seconds=None,
+        start_time=None,
+        end_time=None,
+        metrics={metric.name: None for metric in item.benchmark_profile.score_metrics},
+        flags={metric.name: None for metric in item.benchmark_profile.flag_metrics},
+        raw_verifier={},
+    )
 
 
-def _normalize_run_record(item: family_plan.RunItem, run_data: dict[str, Any]) -> dict[str, Any]:
+def _normalize_run_record(item: family_plan.RunItem, run_data: dict[str, Any]) -> RunRecord:
     verifier_payload = run_data.get("verifier")
     if not isinstance(verifier_payload, dict):
         verifier_payload = {}
@@ -201,61 +218,61 @@ def _normalize_run_record(item: family_plan.RunItem, run_data: dict[str, Any]) -
         for metric in item.benchmark_profile.flag_metrics
     }
 
-    return {
-        "config_name": item.config_name,
-        "benchmark": item.benchmark,
-        "harness": item.harness,
-        "split": item.split,
-        "case_id": item.case_id,
-        "result_path": _relative_display(family_plan.run_output_dir(item)),
-        "artifact_state": "present",
-        "mode": run_data.get("mode", "batch"),
-        "overall_status": overall_status if isinstance(overall_status, str) else "unknown",
-        "agent_status": agent_status if isinstance(agent_status, str) else "unknown",
-        "verifier_status": verifier_status if isinstance(verifier_status, str) else "unknown",
-        "valid": _normalize_valid(
+    return RunRecord(
+        config_name=item.config_name,
+        benchmark=item.benchmark,
+        harness=item.harness,
+        split=item.split,
+        case_id=item.case_id,
+        result_path=_relative_display(family_plan.run_output_dir(item)),
+        artifact_state="present",
+        mode=run_data.get("mode", "batch"),
+        overall_status=overall_status if isinstance(overall_status, str) else "unknown",
+        agent_status=agent_status if isinstance(agent_status, str) else "unknown",
+        verifier_status=verifier_status if isinstance(verifier_status, str) else "unknown",
+        valid=_normalize_valid(
             verifier_payload,
             verifier_status if isinstance(verifier_status, str) else "unknown",
         ),
-        "duration_seconds": run_data.get("duration_seconds")
+        duration_seconds=run_data.get("duration_seconds")
         if _is_numeric(run_data.get("duration_seconds"))
         else None,
-        "start_time": run_data.get("start_time")
+        start_time=run_data.get("start_time")
         if isinstance(run_data.get("start_time"), str)
         else None,
-        "end_time": run_data.get("end_time") if isinstance(run_data.get("end_time"), str) else None,
-        "metrics": metrics,
-        "flags": flags,
-        "raw_verifier": verifier_payload,
-    }
+        end_time=run_data.get("end_time") if isinstance(run_data.get("end_time"), str) else None,
+        metrics=metrics,
+        flags=flags,
+        raw_verifier=verifier_payload,
+    )
 
 
-def _load_expected_records(plan: family_plan.BatchPlan) -> list[dict[str, Any]]:
-    records: list[dict[str, Any]] = []
+def _load_expected_records(plan: family_plan.BatchPlan) -> list[RunRecord]:
+    records: list[RunRecord] = []
     for item in plan.items:
         run_json_path = family_plan.run_output_dir(item) / "run.json"
         if not run_json_path.exists():
-            records.append(_build_missing_record(item))
+            records.append(_build_placeholder_record(item, "missing_artifact"))
             continue
         run_data = _read_run_json(run_json_path)
         if run_data is None:
-            records.append(_build_malformed_record(item))
+            records.append(_build_placeholder_record(item, "malformed_artifact"))
             continue
         records.append(_normalize_run_record(item, run_data))
     return records
 
 
-def _status_counts(records: list[dict[str, Any]], key: str) -> dict[str, int]:
-    counter = Counter(str(record.get(key, "unknown")) for record in records)
+def _status_counts(records: list[RunRecord], key: str) -> dict[str, int]:
+    counter = Counter(str(getattr(record, key)) for record in records)
     return dict(sorted(counter.items()))
 
 
-def _flag_counts(records: list[dict[str, Any]], metric_name: str) -> dict[str, int]:
+def _flag_counts(records: list[RunRecord], metric_name: str) -> dict[str, int]:
     true_count = 0
     false_count = 0
     null_count = 0
     for record in records:
-        value = record["flags"].get(metric_name)
+        value = record.flags.get(metric_name)
         if value is True:
             true_count += 1
         elif value is False:
@@ -280,12 +297,12 @@ def _secondary_metrics(profile: family_plan.BenchmarkProfile) -> tuple[family_pl
     return tuple(metric for metric in profile.score_metrics if metric.role == "secondary")
 
 
-def _metric_values(records: list[dict[str, Any]], metric_name: str) -> list[int | float]:
+def _metric_values(records: list[RunRecord], metric_name: str) -> list[int | float]:
     values: list[int | float] = []
     for record in records:
-        if record["valid"] is not True:
+        if record.valid is not True:
             continue
-        value = record["metrics"].get(metric_name)
+        value = record.metrics.get(metric_name)
         if _is_numeric(value):
             values.append(value)
     return values
@@ -293,16 +310,16 @@ def _metric_values(records: list[dict[str, Any]], metric_name: str) -> list[int
 
 def _build_group_summary(
     *,
-    records: list[dict[str, Any]],
+    records: list[RunRecord],
     profile: family_plan.BenchmarkProfile,
     benchmark: str,
     harness: str | None = None,
 ) -> dict[str, Any]:
     expected_runs = len(records)
-    present_runs = sum(1 for record in records if record["artifact_state"] == "present")
-    missing_runs = sum(1 for record in records if record["artifact_state"] == "missing_artifact")
+    present_runs = sum(1 for record in records if record.artifact_state == "present")
+    missing_runs = sum(1 for record in records if record.artifact_state == "missing_artifact")
     malformed_runs = sum(
-        1 for record in records if record["artifact_state"] == "malformed_artifact"
+        1 for record in records if record.artifact_state == "malformed_artifact"
     )
     primary_metric = _primary_metric(profile)
     secondary_metrics = _secondary_metrics(profile)
@@ -326,8 +343,8 @@ def _build_group_summary(
         "overall_status_counts": _status_counts(records, "overall_status"),
         "agent_status_counts": _status_counts(records, "agent_status"),
         "verifier_status_counts": _status_counts(records, "verifier_status"),
-        "valid_count": sum(1 for record in records if record["valid"] is True),
-        "invalid_count": sum(1 for record in records if record["valid"] is False),
+        "valid_count": sum(1 for record in records if record.valid is True),
+        "invalid_count": sum(1 for record in records if record.valid is False),
         "primary_metric": (
             {
                 "name": primary_metric.name,
@@ -359,7 +376,18 @@ def _ensure_dir(path: Path) -> None:
 
 def _write_json(path: Path, payload: Any) -> None:
     _ensure_dir(path.parent)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    rendered = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(rendered)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    directory_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(directory_fd)
+    finally:
+        os.close(directory_fd)
 
 
 def _write_csv(path: Path, rows: list[dict[str, Any]], fieldnames: list[str]) -> None:
@@ -448,19 +476,20 @@ def main(argv: list[str] | None = None) -> int:
     )
     benchmark_harness_rows: list[dict[str, Any]] = []
     benchmark_json_summaries: dict[str, Any] = {}
+    records_by_benchmark: dict[str, list[RunRecord]] = {}
+    records_by_benchmark_harness: dict[tuple[str, str], list[RunRecord]] = {}
+    for record in records:
+        records_by_benchmark.setdefault(record.benchmark, []).append(record)
+        records_by_benchmark_harness.setdefault((record.benchmark, record.harness), []).append(record)
 
     for benchmark in plan.selected_benchmarks:
         benchmark_profile = next(
             item.benchmark_profile for item in plan.items if item.benchmark == benchmark
         )
-        benchmark_records = [record for record in records if record["benchmark"] == benchmark]
+        benchmark_records = records_by_benchmark.get(benchmark, [])
         per_harness: dict[str, Any] = {}
         for harness in plan.selected_harnesses:
-            harness_records = [
-                record
-                for record in benchmark_records
-                if record["harness"] == harness
-            ]
+            harness_records = records_by_benchmark_harness.get((benchmark, harness), [])
             harness_summary = _build_group_summary(
                 records=harness_records,
                 profile=benchmark_profile,
@@ -521,7 +550,7 @@ def main(argv: list[str] | None = None) -> int:
             "config_path": _relative_display(plan.config.config_path),
             **benchmark_summary,
             "harnesses": per_harness,
-            "runs": benchmark_records,
+            "runs": [record.as_dict() for record in benchmark_records],
         }
         benchmark_json_summaries[benchmark] = {
             key: value for key, value in benchmark_summary_payload.items() if key != "runs"
@@ -532,50 +561,16 @@ def main(argv: list[str] | None = None) -> int:
         flag_fieldnames = [metric.name for metric in benchmark_profile.flag_metrics]
         benchmark_csv_rows = []
         for record in benchmark_records:
-            row = {
-                "config_name": record["config_name"],
-                "benchmark": record["benchmark"],
-                "harness": record["harness"],
-                "split": record["split"],
-                "case_id": record["case_id"],
-                "result_path": record["result_path"],
-                "artifact_state": record["artifact_state"],
-                "mode": record["mode"],
-                "overall_status": record["overall_status"],
-                "agent_status": record["agent_status"],
-                "verifier_status": record["verifier_status"],
-                "valid": record["valid"],
-                "duration_seconds": record["duration_seconds"],
-                "start_time": record["start_time"],
-                "end_time": record["end_time"],
-            }
+            row = {name: getattr(record, name) for name in RUN_CSV_FIELDS}
             for name in metric_fieldnames:
-                row[name] = record["metrics"].get(name)
+                row[name] = record.metrics.get(name)
             for name in flag_fieldnames:
-                row[name] = record["flags"].get(name)
+                row[name] = record.flags.get(name)
             benchmark_csv_rows.append(row)
         _write_csv(
             summaries_root / "benchmarks" / f"{benchmark}.csv",
             benchmark_csv_rows,
-            [
-                "config_name",
-                "benchmark",
-                "harness",
-                "split",
-                "case_id",
-                "result_path",
-                "artifact_state",
-                "mode",
-                "overall_status",
-                "agent_status",
-                "verifier_status",
-                "valid",
-                "duration_seconds",
-                "start_time",
-                "end_time",
-                *metric_fieldnames,
-                *flag_fieldnames,
-            ],
+            [*RUN_CSV_FIELDS, *metric_fieldnames, *flag_fieldnames],
         )
 
     matrix_summary = {
@@ -584,12 +579,12 @@ def main(argv: list[str] | None = None) -> int:
         "config_name": plan.config.config_path.stem,
         "config_path": _relative_display(plan.config.config_path),
         "expected_runs": len(records),
-        "present_runs": sum(1 for record in records if record["artifact_state"] == "present"),
+        "present_runs": sum(1 for record in records if record.artifact_state == "present"),
         "missing_runs": sum(
-            1 for record in records if record["artifact_state"] == "missing_artifact"
+            1 for record in records if record.artifact_state == "missing_artifact"
         ),
         "malformed_runs": sum(
-            1 for record in records if record["artifact_state"] == "malformed_artifact"
+            1 for record in records if record.artifact_state == "malformed_artifact"
         ),
         "overall_status_counts": _status_counts(records, "overall_status"),
         "agent_status_counts": _status_counts(records, "agent_status"),
@@ -25,6 +25,16 @@ OPAQUE_VERIFIER_BUILD_SCRIPT = (
     REPO_ROOT / "experiments" / "_fragments" / "opaque_verifiers" / "build.py"
 )
 INTERACTIVE_WORKSPACES_ROOT = REPO_ROOT / ".runtime" / "interactive_workspaces"
+_BATCH_ONLY_MESSAGE = (
+    "--rerun-status, --no-skip-completed, and --max-concurrency are batch-only controls "
+    "and cannot be used with --interactive."
+)
+INCOMPATIBLE_ARGUMENTS: tuple[tuple[str, str, str], ...] = (
+    ("rerun_status", "no_skip_completed", "--rerun-status and --no-skip-completed cannot be used together."),
+    ("interactive", "rerun_status", _BATCH_ONLY_MESSAGE),
+    ("interactive", "no_skip_completed", _BATCH_ONLY_MESSAGE),
+    ("interactive", "max_concurrency", _BATCH_ONLY_MESSAGE),
+)
 
 
 @dataclass(frozen=True)
@@ -335,6 +345,17 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _argument_is_set(value: Any) -> bool:
+    # store_true flags default to False, append flags to [], and value options to None.
+    return value is not None and value is not False and value != []
+
+
+def validate_argument_combinations(args: argparse.Namespace) -> None:
+    for first, second, message in INCOMPATIBLE_ARGUMENTS:
+        if _argument_is_set(getattr(args, first)) and _argument_is_set(getattr(args, second)):
+            raise SystemExit(message)
+
+
 def _load_yaml_mapping(path: Path, kind: str) -> dict[str, Any]:
     if not path.exists():
         raise SystemExit(f"{kind} file does not exist: {path}")
@@ -1393,8 +1414,7 @@ def describe_interactive_plan(plan: InteractivePlan) -> str:
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
-    if args.rerun_status and args.no_skip_completed:
-        raise SystemExit("--rerun-status and --no-skip-completed cannot be used together.")
+    validate_argument_combinations(args)
     default_config = DEFAULT_INTERACTIVE_CONFIG if args.interactive else DEFAULT_BATCH_CONFIG
     config_path = (args.config or default_config).resolve()
     benchmark_filters = tuple(args.benchmark)
@@ -1402,10 +1422,6 @@ def main(argv: list[str] | None = None) -> int:
     case_filters = tuple(args.case)
 
     if args.interactive:
-        if args.rerun_status or args.no_skip_completed or args.max_concurrency is not None:
-            raise SystemExit(
-                "--rerun-status, --no-skip-completed, and --max-concurrency are batch-only controls and cannot be used with --interactive."
-            )
         plan = build_interactive_plan(
             config_path=config_path,
             benchmark_filters=benchmark_filters,
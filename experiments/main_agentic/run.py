@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import concurrent.futures
+import functools
 import json
 import os
 import re
@@ -761,13 +762,31 @@ def _normalize_cli_verifier_payload(benchmark: str, parsed: dict[str, Any]) -> d
     return normalized
 
 
+@functools.lru_cache(maxsize=None)
+def _float_line_pattern(label: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(label)}:\s+([+-]?(?:\d+(?:\.\d*)?|\.\d+))\s*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _int_line_pattern(label: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(label)}:\s+(\d+)\s*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _cli_section_pattern(section: str) -> re.Pattern[str]:
+    return re.compile(
+        rf"^{re.escape(section)}:\s*$((?:\n\s+- .*)*)",
+        re.MULTILINE,
+    )
+
+
 def _float_line(label: str, text: str) -> float | None:
-    match = re.search(rf"^{re.escape(label)}:\s+([+-]?(?:\d+(?:\.\d*)?|\.\d+))\s*$", text, re.MULTILINE)
+    match = _float_line_pattern(label).search(text)
     return float(match.group(1)) if match else None
 
 
 def _int_line(label: str, text: str) -> int | None:
-    match = re.search(rf"^{re.escape(label)}:\s+(\d+)\s*$", text, re.MULTILINE)
+    match = _int_line_pattern(label).search(text)
     return int(match.group(1)) if match else None
 
 
@@ -779,11 +798,7 @@ def _status_valid(text: str) -> bool | None:
 
 
 def _cli_section_items(text: str, section: str) -> list[str]:
-    pattern = re.compile(
-        rf"^{re.escape(section)}:\s*$((?:\n\s+- .*)*)",
-        re.MULTILINE,
-    )
-    match = pattern.search(text)
+    match = _cli_section_pattern(section).search(text)
     if not match:
         return []
     items: list[str] = []
@@ -1060,15 +1075,15 @@ def _write_run_metadata(
 
 
 def _print_run_summary(output_dir: Path, overall_status: str) -> None:
-    print(f"Results written to {output_dir}")
-    print(f"Run status: {overall_status}")
+    # A single write per block keeps lines from concurrent workers from interleaving.
+    sys.stdout.write(f"Results written to {output_dir}\nRun status: {overall_status}\n")
 
 
 def _print_batch_preview(preview: family_plan.BatchPreview) -> None:
     print(family_plan.describe_batch_preview(preview, include_items=False))
 
 
-def _print_progress_line(
+def _format_progress_line(
     *,
     index: int,
     total: int,
@@ -1077,11 +1092,11 @@ def _print_progress_line(
     executed_count: int,
     skipped_count: int,
     status_counts: dict[str, int],
-) -> None:
+) -> str:
     item = preview_item.item
     counts_text = ", ".join(f"{status}={count}" for status, count in sorted(status_counts.items()))
     action = "skipped" if result.skipped else "executed"
-    print(
+    return (
         f"[{index}/{total}] {item.benchmark}/{item.harness}/{item.case_id} "
         f"-> {result.overall_status} ({action}; executed={executed_count}, skipped={skipped_count}; {counts_text})"
     )
@@ -1090,14 +1105,11 @@ def _print_progress_line(
 def _run_headless_once(
     item: family_plan.RunItem,
     *,
+    runtime: family_plan.RuntimeManifest,
+    case_dir: Path,
+    assemble_specs: tuple[family_plan.AssembleSpec, ...],
     timeout_override: int | None,
 ) -> RunExecutionResult:
-    runtime = family_plan.load_runtime(item.harness_profile.runtime)
-    case_dir = _case_dir(item.benchmark, item.split, item.case_id)
-    if not case_dir.exists():
-        raise SystemExit(f"Case directory does not exist: {case_dir}")
-
-    assemble_specs = _assemble_specs_for_batch_item(item)
     output_dir = family_plan.run_output_dir(item)
     timeout_seconds = timeout_override or item.timeout_seconds
     if output_dir.exists():
@@ -1201,6 +1213,14 @@ def _execute_run_item(
             exit_code=0 if preview_item.existing_overall_status == "success" else 1,
         )
 
+    # Runtime manifest, case directory and assemble specs do not change between
+    # attempts, so resolve them once instead of re-parsing YAML on every retry.
+    runtime = family_plan.load_runtime(item.harness_profile.runtime)
+    case_dir = _case_dir(item.benchmark, item.split, item.case_id)
+    if not case_dir.exists():
+        raise SystemExit(f"Case directory does not exist: {case_dir}")
+    assemble_specs = _assemble_specs_for_batch_item(item)
+
     last_result: RunExecutionResult | None = None
     attempts = batch_settings.max_retries + 1
     for attempt in range(1, attempts + 1):
@@ -1208,7 +1228,13 @@ def _execute_run_item(
             f"Running {item.benchmark}/{item.harness}/{item.case_id} "
             f"(attempt {attempt}/{attempts})"
         )
-        last_result = _run_headless_once(item, timeout_override=timeout_override)
+        last_result = _run_headless_once(
+            item,
+            runtime=runtime,
+            case_dir=case_dir,
+            assemble_specs=assemble_specs,
+            timeout_override=timeout_override,
+        )
         if last_result.overall_status not in batch_settings.retry_statuses:
             return last_result
         if attempt < attempts:
@@ -1254,14 +1280,16 @@ def _run_batch(
             else:
                 executed_count += 1
             status_counts[result.overall_status] = status_counts.get(result.overall_status, 0) + 1
-            _print_progress_line(
-                index=completed,
-                total=total_items,
-                preview_item=preview_item,
-                result=result,
-                executed_count=executed_count,
-                skipped_count=skipped_count,
-                status_counts=status_counts,
+            print(
+                _format_progress_line(
+                    index=completed,
+                    total=total_items,
+                    preview_item=preview_item,
+                    result=result,
+                    executed_count=executed_count,
+                    skipped_count=skipped_count,
+                    status_counts=status_counts,
+                )
             )
     else:
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -1284,16 +1312,19 @@ def _run_batch(
                 else:
                     executed_count += 1
                 status_counts[result.overall_status] = status_counts.get(result.overall_status, 0) + 1
-                _print_progress_line(
-                    index=completed,
-                    total=total_items,
-                    preview_item=preview_item,
-                    result=result,
-                    executed_count=executed_count,
-                    skipped_count=skipped_count,
-                    status_counts=status_counts,
+                print(
+                    _format_progress_line(
+                        index=completed,
+                        total=total_items,
+                        preview_item=preview_item,
+                        result=result,
+                        executed_count=executed_count,
+                        skipped_count=skipped_count,
+                        status_counts=status_counts,
+                    )
                 )
 
+    skipped_lines: list[str] = []
     for preview_item in preview.items:
         if preview_item.action != "skip":
             continue
@@ -1307,15 +1338,19 @@ def _run_batch(
         completed += 1
         skipped_count += 1
         status_counts[result.overall_status] = status_counts.get(result.overall_status, 0) + 1
-        _print_progress_line(
-            index=completed,
-            total=total_items,
-            preview_item=preview_item,
-            result=result,
-            executed_count=executed_count,
-            skipped_count=skipped_count,
-            status_counts=status_counts,
+        skipped_lines.append(
+            _format_progress_line(
+                index=completed,
+                total=total_items,
+                preview_item=preview_item,
+                result=result,
+                executed_count=executed_count,
+                skipped_count=skipped_count,
+                status_counts=status_counts,
+            )
         )
+    if skipped_lines:
+        sys.stdout.write("\n".join(skipped_lines) + "\n")
 
     exit_code = 0
     for result in results:
@@ -1323,13 +1358,15 @@ def _run_batch(
             exit_code = 1
 
     batch_end = _utc_now()
-    print("Batch summary:")
-    print(f"  Total runs considered: {len(results)}")
-    print(f"  Executed runs: {executed_count}")
-    print(f"  Skipped runs: {skipped_count}")
-    print(f"  Wall-clock seconds: {_duration_seconds(batch_start, batch_end)}")
-    for status in sorted(status_counts):
-        print(f"  {status}: {status_counts[status]}")
+    summary_lines = [
+        "Batch summary:",
+        f"  Total runs considered: {len(results)}",
+        f"  Executed runs: {executed_count}",
+        f"  Skipped runs: {skipped_count}",
+        f"  Wall-clock seconds: {_duration_seconds(batch_start, batch_end)}",
+    ]
+    summary_lines.extend(f"  {status}: {status_counts[status]}" for status in sorted(status_counts))
+    sys.stdout.write("\n".join(summary_lines) + "\n")
     return exit_code
 
 
@@ -1434,8 +1471,7 @@ def _run_interactive(
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
-    if args.rerun_status and args.no_skip_completed:
-        raise SystemExit("--rerun-status and --no-skip-completed cannot be used together.")
+    family_plan.validate_argument_combinations(args)
     default_config = (
         family_plan.DEFAULT_INTERACTIVE_CONFIG if args.interactive else family_plan.DEFAULT_BATCH_CONFIG
     )
@@ -1445,10 +1481,6 @@ def main(argv: list[str] | None = None) -> int:
     case_filters = tuple(args.case)
 
     if args.interactive:
-        if args.rerun_status or args.no_skip_completed or args.max_concurrency is not None:
-            raise SystemExit(
-                "--rerun-status, --no-skip-completed, and --max-concurrency are batch-only controls and cannot be used with --interactive."
-            )
         plan = family_plan.build_interactive_plan(
             config_path=config_path,
             benchmark_filters=benchmark_filters,
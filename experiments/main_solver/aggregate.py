@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 from pathlib import Path
 from typing import Any
 
@@ -73,6 +74,21 @@ def _rows(results_root: Path) -> list[dict[str, Any]]:
     return rows
 
 
+def _write_json(path: Path, payload: Any) -> None:
+    rendered = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(rendered)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    directory_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(directory_fd)
+    finally:
+        os.close(directory_fd)
+
+
 def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = [
@@ -117,10 +133,7 @@ def main() -> int:
         "row_count": len(rows),
         "rows": rows,
     }
-    (results_root / "summary.json").write_text(
-        json.dumps(summary, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _write_json(results_root / "summary.json", summary)
     _write_csv(results_root / "summary.csv", rows)
     print(f"wrote {len(rows)} rows to {results_root / 'summary.json'}")
     return 0
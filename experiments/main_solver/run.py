@@ -96,7 +96,6 @@ def _run_command(
     stderr_path: Path,
     env: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    stdout_path.parent.mkdir(parents=True, exist_ok=True)
     start = time.monotonic()
     with stdout_path.open("w", encoding="utf-8") as stdout_obj:
         with stderr_path.open("w", encoding="utf-8") as stderr_obj:
@@ -154,6 +153,7 @@ def _run_setup(
     solver_path = REPO_ROOT / solver["solver_path"]
     setup_script = solver_path / solver.get("setup_script", "setup.sh")
     log_dir = results_root / "_setup" / solver_id
+    log_dir.mkdir(parents=True, exist_ok=True)
     result = _run_command(
         [_script_command(solver_path, setup_script)],
         cwd=solver_path,
@@ -276,7 +276,6 @@ def _verify_solution(job: Job, solution_path: Path, *, log_dir: Path) -> dict[st
 
 
 def _write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
@@ -302,9 +301,12 @@ def _run_runnable_job(
     log_dir = result_dir / "logs"
     if result_dir.exists():
         shutil.rmtree(result_dir)
-    config_dir.mkdir(parents=True, exist_ok=True)
-    solution_dir.mkdir(parents=True, exist_ok=True)
-    log_dir.mkdir(parents=True, exist_ok=True)
+    # Only the job root needs a parents walk; every later write lands in one of
+    # these freshly created subdirectories.
+    result_dir.mkdir(parents=True)
+    config_dir.mkdir()
+    solution_dir.mkdir()
+    log_dir.mkdir()
     solver_config = job.solver.get("config", {})
     if not isinstance(solver_config, dict):
         raise ValueError(f"solver profile {job.solver_id!r} config must be a mapping")
@@ -397,6 +399,7 @@ def _run_literature_job(job: Job, *, results_root: Path) -> dict[str, Any]:
     }
     if case_metrics is None:
         payload["status"] = "missing_reported_metrics"
+    result_dir.mkdir(parents=True, exist_ok=True)
     _write_json(result_dir / "run.json", payload)
     return payload
 
@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import statistics
 from collections import Counter
 from datetime import datetime, timezone
@@ -257,6 +258,21 @@ def _paired_deltas(
     return deltas
 
 
+def _write_json(path: Path, payload: Any) -> None:
+    rendered = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(rendered)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    directory_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(directory_fd)
+    finally:
+        os.close(directory_fd)
+
+
 def _write_csv(path: Path, rows: list[dict[str, Any]], fieldnames: list[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="") as handle:
@@ -276,10 +292,7 @@ def main(argv: list[str] | None = None) -> int:
     deltas = _paired_deltas(rows, baseline_split=baseline_split, shifted_split=shifted_split)
     aggregate_dir = _aggregate_dir(config, config_path)
     aggregate_dir.mkdir(parents=True, exist_ok=True)
-    (aggregate_dir / "summary.json").write_text(
-        json.dumps(summary, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _write_json(aggregate_dir / "summary.json", summary)
     run_fields = [
         "split",
         "benchmark",
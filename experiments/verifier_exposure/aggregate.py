@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import statistics
 from collections import Counter
 from datetime import datetime, timezone
@@ -181,10 +182,17 @@ def _records(config: dict[str, Any], config_path: Path) -> list[dict[str, Any]]:
 
 
 def _summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    exposures = sorted({str(row["exposure"]) for row in rows})
+    # Partition once rather than rescanning every row for each exposure/harness group.
+    rows_by_exposure: dict[str, list[dict[str, Any]]] = {}
+    rows_by_exposure_harness: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for row in rows:
+        exposure = str(row["exposure"])
+        rows_by_exposure.setdefault(exposure, []).append(row)
+        rows_by_exposure_harness.setdefault((exposure, str(row["harness"])), []).append(row)
+
     by_exposure: dict[str, Any] = {}
-    for exposure in exposures:
-        exposure_rows = [row for row in rows if row["exposure"] == exposure]
+    for exposure in sorted(rows_by_exposure):
+        exposure_rows = rows_by_exposure[exposure]
         valid_values = [row["valid"] for row in exposure_rows if isinstance(row["valid"], bool)]
         by_exposure[exposure] = {
             "run_count": len(exposure_rows),
@@ -207,26 +215,25 @@ def _summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
             ),
         }
     by_exposure_harness: dict[str, Any] = {}
-    for exposure in exposures:
-        for harness in sorted({str(row["harness"]) for row in rows if row["exposure"] == exposure}):
-            group_rows = [row for row in rows if row["exposure"] == exposure and row["harness"] == harness]
-            valid_values = [row["valid"] for row in group_rows if isinstance(row["valid"], bool)]
-            by_exposure_harness[f"{exposure}/{harness}"] = {
-                "run_count": len(group_rows),
-                "valid_count": sum(1 for value in valid_values if value),
-                "valid_rate": (sum(1 for value in valid_values if value) / len(valid_values)) if valid_values else None,
-                "overall_status_counts": dict(Counter(str(row["overall_status"]) for row in group_rows)),
-                "mean_service_fraction": _mean(
-                    [row["service_fraction"] for row in group_rows if isinstance(row["service_fraction"], float)]
-                ),
-                "mean_worst_demand_service_fraction": _mean(
-                    [
-                        row["worst_demand_service_fraction"]
-                        for row in group_rows
-                        if isinstance(row["worst_demand_service_fraction"], float)
-                    ]
-                ),
-            }
+    for exposure, harness in sorted(rows_by_exposure_harness):
+        group_rows = rows_by_exposure_harness[(exposure, harness)]
+        valid_values = [row["valid"] for row in group_rows if isinstance(row["valid"], bool)]
+        by_exposure_harness[f"{exposure}/{harness}"] = {
+            "run_count": len(group_rows),
+            "valid_count": sum(1 for value in valid_values if value),
+            "valid_rate": (sum(1 for value in valid_values if value) / len(valid_values)) if valid_values else None,
+            "overall_status_counts": dict(Counter(str(row["overall_status"]) for row in group_rows)),
+            "mean_service_fraction": _mean(
+                [row["service_fraction"] for row in group_rows if isinstance(row["service_fraction"], float)]
+            ),
+            "mean_worst_demand_service_fraction": _mean(
+                [
+                    row["worst_demand_service_fraction"]
+                    for row in group_rows
+                    if isinstance(row["worst_demand_service_fraction"], float)
+                ]
+            ),
+        }
     return {
         "schema_version": 1,
         "experiment": "verifier_exposure",
@@ -236,6 +243,21 @@ def _summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
+def _write_json(path: Path, payload: Any) -> None:
+    rendered = (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(rendered)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    directory_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(directory_fd)
+    finally:
+        os.close(directory_fd)
+
+
 def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
     fieldnames = [
         "exposure",
@@ -268,10 +290,7 @@ def main(argv: list[str] | None = None) -> int:
     rows = _records(config, config_path)
     summary = _summary(rows)
     aggregate_dir.mkdir(parents=True, exist_ok=True)
-    (aggregate_dir / "summary.json").write_text(
-        json.dumps(summary, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _write_json(aggregate_dir / "summary.json", summary)
     _write_csv(aggregate_dir / "runs.csv", rows)
     print(f"Wrote {aggregate_dir / 'summary.json'}")
     print(f"Wrote {aggregate_dir / 'runs.csv'}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 from typing import Any
@@ -329,8 +330,27 @@ def is_sunlit(
     return illumination > 0.5
 
 
-def _contains_offset(intervals: list[tuple[float, float, str]], offset_s: float) -> bool:
-    return any(start_s <= offset_s < end_s for start_s, end_s, _ in intervals)
+def _interval_index(
+    intervals: list[tuple[float, float, str]],
+) -> tuple[list[float], list[float]]:
+    """Sorted starts plus the running maximum end, for bisect lookups."""
+    ordered = sorted(intervals, key=lambda item: item[0])
+    starts: list[float] = []
+    reach: list[float] = []
+    furthest_end_s = float("-inf")
+    for start_s, end_s, _ in ordered:
+        furthest_end_s = max(furthest_end_s, end_s)
+        starts.append(start_s)
+        reach.append(furthest_end_s)
+    return starts, reach
+
+
+def _contains_offset(index: tuple[list[float], list[float]], offset_s: float) -> bool:
+    # Some interval with start <= offset ends after it iff the furthest end among
+    # those intervals does; intervals may overlap on invalid schedules.
+    starts, reach = index
+    position = bisect_right(starts, offset_s)
+    return position > 0 and reach[position - 1] > offset_s
 
 
 def _resource_time_points(
@@ -442,16 +462,18 @@ def battery_issues(
         )
         issues.extend(slew_issues)
         time_points = _resource_time_points(case, imaging_intervals, slew_intervals)
+        imaging_index = _interval_index(imaging_intervals)
+        slew_index = _interval_index(slew_intervals)
         for start_s, end_s in zip(time_points, time_points[1:]):
             delta_s = end_s - start_s
             if delta_s <= 0.0:
                 continue
             midpoint_s = start_s + (0.5 * delta_s)
             load_w = resource.idle_power_w
-            if _contains_offset(imaging_intervals, midpoint_s):
+            if _contains_offset(imaging_index, midpoint_s):
                 load_w += resource.imaging_power_w
                 total_imaging_time_s += delta_s
-            if _contains_offset(slew_intervals, midpoint_s):
+            if _contains_offset(slew_index, midpoint_s):
                 load_w += resource.slew_power_w
                 total_slew_time_s += delta_s
             charge_w = (
@@ -732,32 +754,37 @@ def _candidate_priority(candidate: Candidate) -> tuple[Any, ...]:
     return (candidate.utility, candidate.utility_tie_break)
 
 
+def _candidates_by_satellite(candidates: list[Candidate]) -> dict[str, list[Candidate]]:
+    by_satellite: dict[str, list[Candidate]] = {}
+    for candidate in candidates:
+        by_satellite.setdefault(candidate.satellite_id, []).append(candidate)
+    return by_satellite
+
+
 def _choose_removal(
     issue: ValidationIssue,
-    candidates: list[Candidate],
+    candidate_by_id: dict[str, Candidate],
+    candidates_by_satellite: dict[str, list[Candidate]],
 ) -> Candidate | None:
     if issue.reason == "battery_depletion":
         if issue.satellite_id is None:
             return None
         # Remove lowest-utility candidate on the failing satellite that starts
         # at or before the depletion point.
+        satellite_candidates = candidates_by_satellite.get(issue.satellite_id, [])
         cutoff_s = issue.offset_s if issue.offset_s is not None else float("inf")
         same_satellite = [
             candidate
-            for candidate in candidates
-            if candidate.satellite_id == issue.satellite_id
-            and candidate.start_offset_s <= cutoff_s + NUMERICAL_EPS
+            for candidate in satellite_candidates
+            if candidate.start_offset_s <= cutoff_s + NUMERICAL_EPS
         ]
         if not same_satellite:
-            same_satellite = [
-                candidate for candidate in candidates if candidate.satellite_id == issue.satellite_id
-            ]
+            same_satellite = satellite_candidates
         if not same_satellite:
             return None
         return min(same_satellite, key=_candidate_priority)
 
     # For non-battery issues, remove the lowest-utility implicated candidate.
-    candidate_by_id = {candidate.candidate_id: candidate for candidate in candidates}
     implicated = [
         candidate_by_id[candidate_id]
         for candidate_id in issue.candidate_ids
@@ -799,8 +826,10 @@ def repair_schedule(
         if iteration >= config.max_repair_iterations:
             break
         removal = None
+        candidate_by_id = {candidate.candidate_id: candidate for candidate in current}
+        candidates_by_satellite = _candidates_by_satellite(current)
         for issue in report.issues:
-            removal = _choose_removal(issue, current)
+            removal = _choose_removal(issue, candidate_by_id, candidates_by_satellite)
             if removal is not None:
                 break
         if removal is None:
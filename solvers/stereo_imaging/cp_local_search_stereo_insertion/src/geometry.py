@@ -77,9 +77,11 @@ def _angle_between_deg(a: np.ndarray, b: np.ndarray) -> float:
     return math.degrees(math.acos(c))
 
 
-# Cache for satellite state lookups; keyed by (satellite_id, dt_isoformat).
-# This eliminates repeated SGP4 propagation for the same fixed candidate times.
-_sat_state_cache: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+# Cache for satellite state lookups; keyed by (satellite_id, aware datetime).
+# Aware datetimes hash by instant, so keying on them directly avoids formatting
+# an ISO string per lookup. This eliminates repeated SGP4 propagation for the
+# same fixed candidate times.
+_sat_state_cache: dict[tuple[str, datetime], tuple[np.ndarray, np.ndarray]] = {}
 
 
 def _clear_sat_state_cache() -> None:
@@ -87,11 +89,12 @@ def _clear_sat_state_cache() -> None:
 
 
 def _satellite_state_ecef_m(sat: EarthSatellite, dt: datetime) -> tuple[np.ndarray, np.ndarray]:
-    key = (sat.name, dt.astimezone(UTC).isoformat())
+    dt_utc = dt.astimezone(UTC)
+    key = (sat.name, dt_utc)
     cached = _sat_state_cache.get(key)
     if cached is not None:
         return cached
-    t = _TS.from_datetime(dt.astimezone(UTC))
+    t = _TS.from_datetime(dt_utc)
     g = sat.at(t)
     pos, vel = g.frame_xyz_and_velocity(itrs)
     pos_m = np.asarray(pos.km, dtype=float).reshape(3) * 1000.0
@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import random
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
 from case_io import StereoCase
@@ -140,6 +140,8 @@ class LocalSearchState:
     sequence_state: SequenceState
     scheduled_products: dict[str, StereoProduct]  # product_id -> product
     target_to_product_id: dict[str, str]  # target_id -> product_id
+    # target_id -> {product_id -> product}, kept in step with scheduled_products
+    products_by_target: dict[str, dict[str, StereoProduct]] = field(default_factory=dict)
 
     @classmethod
     def from_seed(
@@ -151,7 +153,7 @@ class LocalSearchState:
             target_to_product_id={},
         )
         for product in seed_products:
-            state.scheduled_products[product.product_id] = product
+            state._schedule(product)
             current = state.target_to_product_id.get(product.target_id)
             if current is None or product.quality > state.scheduled_products[current].quality:
                 state.target_to_product_id[product.target_id] = product.product_id
@@ -177,8 +179,25 @@ class LocalSearchState:
             sequence_state=_clone_sequence_state(self.sequence_state),
             scheduled_products=dict(self.scheduled_products),
             target_to_product_id=dict(self.target_to_product_id),
+            products_by_target={
+                target_id: dict(products)
+                for target_id, products in self.products_by_target.items()
+            },
         )
 
+    def _schedule(self, product: StereoProduct) -> None:
+        self.scheduled_products[product.product_id] = product
+        self.products_by_target.setdefault(product.target_id, {})[product.product_id] = product
+
+    def _unschedule(self, product_id: str) -> None:
+        product = self.scheduled_products.pop(product_id, None)
+        if product is None:
+            return
+        same_target = self.products_by_target[product.target_id]
+        same_target.pop(product_id, None)
+        if not same_target:
+            del self.products_by_target[product.target_id]
+
     def add_product(self, product: StereoProduct, case: StereoCase) -> bool:
         """Insert a product, enforcing at most one product per target.
 
@@ -198,8 +217,8 @@ class LocalSearchState:
             if not result.success:
                 _restore_state(self.sequence_state, snapshot)
                 return False
-            self.scheduled_products.pop(current, None)
-            self.scheduled_products[product.product_id] = product
+            self._unschedule(current)
+            self._schedule(product)
             self.target_to_product_id[product.target_id] = product.product_id
             return True
 
@@ -207,18 +226,17 @@ class LocalSearchState:
         result = _seq_insert_product(product, self.sequence_state, case)
         if not result.success:
             return False
-        self.scheduled_products[product.product_id] = product
+        self._schedule(product)
         self.target_to_product_id[product.target_id] = product.product_id
         return True
 
     def remove_product(self, product: StereoProduct, case: StereoCase) -> None:
         _seq_remove_product(product, self.sequence_state, case)
-        self.scheduled_products.pop(product.product_id, None)
+        self._unschedule(product.product_id)
         best: StereoProduct | None = None
-        for p in self.scheduled_products.values():
-            if p.target_id == product.target_id:
-                if best is None or p.quality > best.quality:
-                    best = p
+        for p in self.products_by_target.get(product.target_id, {}).values():
+            if best is None or p.quality > best.quality:
+                best = p
         if best is not None:
             self.target_to_product_id[product.target_id] = best.product_id
         else:
@@ -18,7 +18,14 @@ from typing import Any
 
 from case_io import StereoCase
 from products import ProductLibrary, ProductType, StereoProduct
-from sequence import SequenceState, create_empty_state, insert_product
+from sequence import (
+    SequenceState,
+    _restore_state,
+    _snapshot_state,
+    create_empty_state,
+    insert_product,
+    remove_product,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -348,7 +355,6 @@ def build_greedy_seed(
                 continue
 
             # Attempt upgrade: remove pair, insert tri
-            from sequence import remove_product, _snapshot_state, _restore_state
             snapshot = _snapshot_state(state)
             remove_product(current, state, case)
 
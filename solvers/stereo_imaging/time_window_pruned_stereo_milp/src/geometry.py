@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 import brahe
 import numpy as np
@@ -35,7 +36,10 @@ def _datetime_to_epoch(value: datetime) -> brahe.Epoch:
     )
 
 
+@lru_cache(maxsize=None)
 def make_earth_satellite(sat: Satellite) -> EarthSatellite:
+    # Satellite is frozen, so the parsed TLE can be shared by every caller
+    # (candidate generation, MILP model, products and per-pair repair checks).
     return EarthSatellite(sat.tle_line1, sat.tle_line2, name=sat.id, ts=_TS)
 
 
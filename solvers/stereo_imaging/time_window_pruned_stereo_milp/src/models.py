@@ -85,7 +85,7 @@ class Mission:
     quality_model: QualityModel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccessInterval:
     sat_id: str
     target_id: str
@@ -94,7 +94,7 @@ class AccessInterval:
     end: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CandidateObservation:
     sat_id: str
     target_id: str
@@ -106,7 +106,7 @@ class CandidateObservation:
     combined_off_nadir_deg: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RejectionRecord:
     sat_id: str
     target_id: str
@@ -159,7 +159,7 @@ class CandidateSummary:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StereoPair:
     target_id: str
     candidate_i: CandidateObservation
@@ -219,7 +219,7 @@ class StereoPair:
         return "__multiple_intervals__"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TriStereoSet:
     target_id: str
     candidates: tuple[CandidateObservation, CandidateObservation, CandidateObservation]
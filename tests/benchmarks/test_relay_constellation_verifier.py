@@ -94,6 +94,39 @@ def test_verify_solution_rejects_malformed_solution(tmp_path: Path) -> None:
     assert result.violations == ["solution.json must be a JSON object"]
 
 
+def test_verify_solution_reports_missing_case_file(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case_missing_demands"
+    fixture_dir = FIXTURES_DIR / "full_service_valid"
+    for filename in ("manifest.json", "network.json"):
+        (case_dir / filename).parent.mkdir(parents=True, exist_ok=True)
+        (case_dir / filename).write_text(
+            (fixture_dir / filename).read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+
+    result = verify_solution(case_dir, fixture_dir / "solution.json")
+
+    assert result.valid is False
+    assert result.violations == [f"Missing case file: {case_dir.resolve() / 'demands.json'}"]
+
+
+def test_verify_solution_reports_directory_named_like_case_file(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case_demands_is_directory"
+    fixture_dir = FIXTURES_DIR / "full_service_valid"
+    for filename in ("manifest.json", "network.json"):
+        (case_dir / filename).parent.mkdir(parents=True, exist_ok=True)
+        (case_dir / filename).write_text(
+            (fixture_dir / filename).read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+    (case_dir / "demands.json").mkdir()
+
+    result = verify_solution(case_dir, fixture_dir / "solution.json")
+
+    assert result.valid is False
+    assert result.violations == [f"Missing case file: {case_dir.resolve() / 'demands.json'}"]
+
+
 def test_verify_solution_rejects_duplicate_demand_ids(tmp_path: Path) -> None:
     case_dir = tmp_path / "case_duplicate_demands"
     fixture_dir = FIXTURES_DIR / "full_service_valid"
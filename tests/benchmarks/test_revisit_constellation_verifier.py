@@ -325,6 +325,16 @@ def test_load_case_rejects_missing_assets_file(tmp_path: Path) -> None:
         load_case(case_dir)
 
 
+def test_load_case_rejects_directory_named_like_assets_file(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    _write_json(case_dir / "mission.json", _base_mission())
+    (case_dir / "assets.json").mkdir()
+
+    with pytest.raises(FileNotFoundError, match="Missing case file"):
+        load_case(case_dir)
+
+
 def test_load_case_rejects_duplicate_target_ids(tmp_path: Path) -> None:
     mission = _base_mission()
     duplicate_target = deepcopy(mission["targets"][0])